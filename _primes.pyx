@@ -0,0 +1,40 @@
+# cython: language_level=3
+"""
+Compiled prime helpers for python_gil_demonstration.
+
+The prime sum runs without holding the GIL, so threads calling
+prime_sum_c can execute on several cores at once.
+"""
+
+
+cdef bint is_prime_c(long long n) nogil:
+    """Check if a number is prime."""
+    cdef long long i
+    if n <= 1:
+        return False
+    if n <= 3:
+        return True
+    if n % 2 == 0 or n % 3 == 0:
+        return False
+    i = 5
+    while i * i <= n:
+        if n % i == 0 or n % (i + 2) == 0:
+            return False
+        i += 6
+    return True
+
+
+cdef long long _prime_sum(long long n) nogil:
+    cdef long long i, s = 0
+    for i in range(2, n + 1):
+        if is_prime_c(i):
+            s += i
+    return s
+
+
+cpdef long long prime_sum_c(long long n):
+    """Return the sum of all prime numbers from 2 to n."""
+    cdef long long s
+    with nogil:
+        s = _prime_sum(n)
+    return s
@@ -0,0 +1,16 @@
+"""
+Build script for the optional Cython extension used by python_gil_demonstration.
+
+Usage:
+    python setup.py build_ext --inplace
+"""
+
+from setuptools import setup
+from Cython.Build import cythonize
+
+setup(
+    ext_modules=cythonize(
+        ["_primes.pyx"],
+        compiler_directives={'boundscheck': False, 'wraparound': False},
+    ),
+)
@@ -1,7 +1,9 @@
 """ Exceptional tests for Python GIL Analysis solution. Tests error handling and exception cases. """
+import os
 import pytest
+from concurrent.futures.process import BrokenProcessPool
 from python_gil_demonstration import (
-    run_sequential, run_threading, run_multiprocessing,
+    cpu_intensive_task, run_sequential, run_threading, run_multiprocessing,
     compare_performance
 )
 
@@ -44,4 +46,23 @@ class TestExceptional:
         
         # Invalid task_type
         with pytest.raises(ValueError):
-            compare_performance("INVALID_TYPE", dummy_func, args_list, 2)
\ No newline at end of file
+            compare_performance("INVALID_TYPE", dummy_func, args_list, 2)
+        
+        # Invalid worker counts for the comparison, for either task type
+        with pytest.raises(ValueError):
+            compare_performance('CPU-bound', cpu_intensive_task, [10, 20], 0)
+        
+        with pytest.raises(ValueError):
+            compare_performance('CPU-bound', cpu_intensive_task, [10, 20], -1)
+        
+        with pytest.raises(ValueError):
+            compare_performance('I/O-bound', dummy_func, args_list, 0)
+    
+    def test_dead_worker_raises(self):
+        """A worker process that dies must raise instead of hanging."""
+        with pytest.raises(BrokenProcessPool):
+            run_multiprocessing(os._exit, [1], 1)
+        
+        # The broken pool is replaced on the next call
+        results, _ = run_multiprocessing(cpu_intensive_task, [5], 1)
+        assert results == [10]
\ No newline at end of file
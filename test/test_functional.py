@@ -1,8 +1,13 @@
 """ Functional tests for Python GIL Analysis solution. Tests the correctness of the implementation logic. """
+import array
+import asyncio
+import ctypes
+import sys
 import pytest
 from python_gil_demonstration import (
-    is_prime, cpu_intensive_task, io_intensive_task,
-    run_sequential, run_threading, run_multiprocessing
+    is_prime, cpu_intensive_task, io_intensive_task, io_intensive_task_async,
+    run_sequential, run_threading, run_multiprocessing, run_multiprocessing_shm, run_asyncio,
+    compare_performance, shutdown_pools, _batch_prime_sums, _shm_format
 )
 
 class TestFunctional:
@@ -34,6 +39,24 @@ class TestFunctional:
         assert cpu_intensive_task(3) == 5  # 2+3
         assert cpu_intensive_task(10) == 17  # 2+3+5+7
         assert cpu_intensive_task(15) == 41  # Sum of primes up to 15
+        
+        # Around the sieve's 65536-number segment boundaries
+        assert cpu_intensive_task(65535) == 202288087
+        assert cpu_intensive_task(65536) == 202288087
+        assert cpu_intensive_task(65537) == 202353624  # 65537 is prime
+        assert cpu_intensive_task(131073) == 761593692
+        assert cpu_intensive_task(400000) == 6458901531
+    
+    def test_batch_prime_sums(self):
+        """Test that the shared-sieve batch matches per-argument calls."""
+        assert _batch_prime_sums([]) == []
+        
+        # n <= 2 follows cpu_intensive_task's edge case
+        assert _batch_prime_sums([0, 1, 2]) == [0, 0, 0]
+        
+        # Unsorted input with repeats and segment boundaries
+        ns = [65537, 3, 15, 0, 10, 131073, 15, 2, 65535]
+        assert _batch_prime_sums(ns) == [cpu_intensive_task(n) for n in ns]
     
     def test_io_task(self):
         """Test I/O-bound task functionality."""
@@ -45,6 +68,9 @@ class TestFunctional:
         result = io_intensive_task(0.01)
         assert "Completed I/O operation" in result
         assert "0.01 seconds" in result
+        
+        # Async variant returns the same message
+        assert asyncio.run(io_intensive_task_async(0.01)) == result
     
     def test_sequential_execution(self):
         """Test sequential execution method."""
@@ -96,4 +122,83 @@ class TestFunctional:
         
         # More workers than tasks
         many_results, _ = run_multiprocessing(cpu_intensive_task, [5], 5)
-        assert many_results == [10]
\ No newline at end of file
+        assert many_results == [10]
+        
+        # Pools are recreated on demand after being shut down
+        shutdown_pools()
+        assert run_multiprocessing(cpu_intensive_task, args_list, 2)[0] == [10, 17, 41]
+        assert run_threading(cpu_intensive_task, args_list, 2)[0] == [10, 17, 41]
+    
+    def test_shared_memory_multiprocessing_execution(self):
+        """Test multiprocessing execution over shared memory buffers."""
+        # Buffers are passed through shared memory
+        arrays = [array.array('d', range(1000)), array.array('i', [5, 10, 15]), array.array('q')]
+        results, time = run_multiprocessing_shm(sum, arrays, 2)
+        assert results == [499500.0, 30, 0]
+        assert time > 0
+        
+        # Multi-dimensional buffers keep their shape; empty ones arrive as 1-D views
+        grid = memoryview(bytes(range(6))).cast('B', (2, 3))
+        shaped, _ = run_multiprocessing_shm(memoryview.tolist, [grid, bytearray()], 2)
+        assert shaped == [[[0, 1, 2], [3, 4, 5]], []]
+        
+        # Explicit native byte order (as ctypes reports it) is accepted
+        doubles = (ctypes.c_double * 3)(1.5, 2.5, 3.0)
+        assert run_multiprocessing_shm(sum, [doubles], 1)[0] == [7.0]
+        
+        # Formats memoryview.cast cannot rebuild are detected
+        big_endian = memoryview((ctypes.c_int32.__ctype_be__ * 2)())
+        assert _shm_format(big_endian) == ('i' if sys.byteorder == 'big' else None)
+        assert _shm_format(memoryview(doubles)) == 'd'
+        
+        # Non-buffer arguments fall back to the regular path
+        int_results, _ = run_multiprocessing_shm(cpu_intensive_task, [5, 10, 15], 2)
+        assert int_results == [10, 17, 41]
+        
+        # Empty list
+        empty_results, _ = run_multiprocessing_shm(sum, [], 2)
+        assert empty_results == []
+    
+    def test_asyncio_execution(self):
+        """Test asyncio execution method."""
+        # Coroutine function
+        results, time = run_asyncio(io_intensive_task_async, [0.01, 0.02])
+        assert results == [
+            "Completed I/O operation that took 0.01 seconds",
+            "Completed I/O operation that took 0.02 seconds"
+        ]
+        assert time > 0
+        
+        # Blocking function is offloaded to threads
+        cpu_results, _ = run_asyncio(cpu_intensive_task, [5, 10, 15])
+        assert cpu_results == [10, 17, 41]
+        
+        # Empty list
+        empty_results, _ = run_asyncio(io_intensive_task_async, [])
+        assert empty_results == []
+    
+    def test_compare_performance_worker_sizing(self, capsys):
+        """Test how compare_performance sizes its worker pools."""
+        # CPU-bound: num_workers, capped at the number of tasks
+        compare_performance('CPU-bound', cpu_intensive_task, [10, 20], 8)
+        assert "CPU-bound task (2 workers)" in capsys.readouterr().out
+        
+        compare_performance('CPU-bound', cpu_intensive_task, [10, 20, 30], 2)
+        assert "CPU-bound task (2 workers)" in capsys.readouterr().out
+        
+        # Tuple-form and mixed arguments are accepted like in the run_* functions
+        timings = compare_performance('CPU-bound', cpu_intensive_task, [(100,), (200,)], 2)
+        assert "CPU-bound task (2 workers)" in capsys.readouterr().out
+        assert timings['sequential'] > 0
+        
+        compare_performance('CPU-bound', cpu_intensive_task, [100, (200,)], 4)
+        assert "CPU-bound task (2 workers)" in capsys.readouterr().out
+        
+        # I/O-bound: one worker per task, regardless of num_workers
+        timings = compare_performance('I/O-bound', io_intensive_task, [0, 0, 0], 1)
+        assert "I/O-bound task (3 workers)" in capsys.readouterr().out
+        assert 'asyncio' in timings
+        
+        # Empty task list still runs with a single worker
+        compare_performance('CPU-bound', cpu_intensive_task, [], 4)
+        assert "CPU-bound task (1 workers)" in capsys.readouterr().out
\ No newline at end of file